@@ -1,13 +1,15 @@
+import os
 import streamlit as st
 import pandas as pd
+import numpy as np
 import requests
 import altair as alt
 
 # Set page config
 st.set_page_config(page_title="🏆 PHF Premier Auction - Player Stats Dashboard", layout="wide")
 
-# CSS to inject for specific styling if needed
-st.markdown("""
+# CSS to inject for specific styling if needed (single block, emitted once per run)
+APP_CSS = """
 <style>
     /* Force center alignment for all dataframe cells - multiple selectors for maximum coverage */
     .stDataFrame th,
@@ -59,35 +61,109 @@ st.markdown("""
         font-weight: bold;
         color: #ff4b4b;
     }
+    
+    /* Award boxes rendered side by side from one markdown call */
+    .award-row {
+        display: flex;
+        gap: 1rem;
+    }
+    
+    .award-row .award-box {
+        flex: 1;
+    }
+    
+    /* Main Tab Navigation */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 2px;
+    }
+    .stTabs [data-baseweb="tab"] {
+        height: 50px;
+        white-space: pre-wrap;
+        background-color: transparent;
+        border-radius: 4px 4px 0px 0px;
+        gap: 1px;
+        padding-top: 10px;
+        padding-bottom: 10px;
+    }
+    .stTabs [aria-selected="true"] {
+         background-color: rgba(255, 255, 255, 0.05);
+         border-bottom: 2px solid #FF4B4B;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+AWARDS_TEMPLATE = """
+<div class="award-row">
+    <div class="award-box">
+        <div class="award-icon">🏏</div>
+        <div class="award-title">Best Batter</div>
+        <div class="award-count">{best_batter}</div>
+    </div>
+    <div class="award-box">
+        <div class="award-icon">🥎</div>
+        <div class="award-title">Best Bowler</div>
+        <div class="award-count">{best_bowler}</div>
+    </div>
+    <div class="award-box">
+        <div class="award-icon">🏆</div>
+        <div class="award-title">Player of the Match</div>
+        <div class="award-count">{potm}</div>
+    </div>
+</div>
+"""
+
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # Title
 st.title("🏆 PHF Premier Auction Season 1 - Player Stats Dashboard")
 
 # Load the dataset
+DATA_FILE = "1503_PHFT20_players_with_stats_enhanced.xlsx"
+# Columnar copy of DATA_FILE, written on first load; reused while newer than the xlsx
+PARQUET_FILE = "players.parquet"
+
+def read_parquet_cache():
+    if not os.path.exists(PARQUET_FILE):
+        return None
+    # Stale if the xlsx was updated since; with no xlsx on disk the copy is all there is
+    if os.path.exists(DATA_FILE) and os.path.getmtime(PARQUET_FILE) < os.path.getmtime(DATA_FILE):
+        return None
+    try:
+        return pd.read_parquet(PARQUET_FILE, engine='pyarrow')
+    except Exception:
+        # Unreadable file or pyarrow missing: fall back to Excel
+        return None
+
 @st.cache_data
 def load_data():
-    file_path = "1503_PHFT20_players_with_stats_enhanced.xlsx"
     try:
-        df = pd.read_excel(file_path)
-        # Clean up name column
+        df = read_parquet_cache()
+        if df is None:
+            df = pd.read_excel(DATA_FILE)
+            # Clean up name column
+            if 'name' in df.columns:
+                df['name'] = df['name'].astype(str).str.strip()
+            
+            # Fix types for Arrow compatibility
+            if 'cricheroes' in df.columns:
+                df['cricheroes'] = df['cricheroes'].astype(str)
+            if 'extracted_id' in df.columns:
+                df['extracted_id'] = df['extracted_id'].astype(str)
+
+            try:
+                df.to_parquet(PARQUET_FILE, engine='pyarrow', index=False)
+            except Exception:
+                pass # Read-only deploy or pyarrow missing; Excel still works
+
+        # Categorical names: unique/isin/index lookups work on integer codes, not strings
         if 'name' in df.columns:
-            df['name'] = df['name'].astype(str).str.strip()
-        
-        # Fix types for Arrow compatibility
-        if 'cricheroes' in df.columns:
-            df['cricheroes'] = df['cricheroes'].astype(str)
-        if 'extracted_id' in df.columns:
-            df['extracted_id'] = df['extracted_id'].astype(str)
+            df['name'] = df['name'].astype('category')
             
         return df
     except Exception as e:
         st.error(f"Error loading file: {e}")
         return pd.DataFrame()
 
-df = load_data()
-
 def clean_and_convert_numeric(df):
     # List of columns that must be numeric
     # Batting
@@ -99,226 +175,481 @@ def clean_and_convert_numeric(df):
     
     # Specific cleanup for High Score (remove *)
     if 'Overall_Batting_HS' in df.columns:
-        df['Overall_Batting_HS'] = df['Overall_Batting_HS'].astype(str).str.replace('*', '', regex=False)
-        df['Overall_Batting_HS'] = pd.to_numeric(df['Overall_Batting_HS'], errors='coerce').fillna(0)
+        df['Overall_Batting_HS'] = pd.to_numeric(df['Overall_Batting_HS'].astype(str).str.replace('*', '', regex=False), errors='coerce').fillna(0)
 
     all_numeric = bat_cols + bowl_cols
-    for col in all_numeric:
-        if col in df.columns:
-            # Force numeric, turning non-parseable things (like '-') into NaN then 0
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    present = [col for col in all_numeric if col in df.columns]
+    # Force numeric, turning non-parseable things (like '-') into NaN then 0
+    df[present] = df[present].apply(pd.to_numeric, errors='coerce').fillna(0)
             
     return df
 
-df = clean_and_convert_numeric(df)
+def downcast_numeric(df):
+    # Halve the Arrow payload behind every st.dataframe: float32 for rates, int32 for counts
+    float_like = ['Overall_Batting_Avg', 'Overall_Batting_SR', 'Overall_Batting_HS', 'Overall_Bowling_Eco',
+                  'Overall_Bowling_Avg', 'Overall_Bowling_SR', 'Overall_Bowling_Overs']
+    int_like = ['Overall_Batting_Runs', 'Overall_Batting_Mat', 'Overall_Batting_Inns', 'Overall_Batting_4s',
+                'Overall_Batting_6s', 'Overall_Bowling_Wkts', 'Overall_Bowling_Mat', 'Overall_Bowling_Inns',
+                'BEST BATTER', 'BEST BOWLER', 'PLAYER OF THE MATCH']
+
+    float_present = [col for col in float_like if col in df.columns]
+    df[float_present] = df[float_present].astype('float32')
+
+    # Counts may be blank for players without stats; treat those as 0
+    int_present = [col for col in int_like if col in df.columns]
+    df[int_present] = df[int_present].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int32')
+    return df
 
 # --- feature: Auction Metrics ---
-def safe_float(val):
-    try:
-        return float(val)
-    except:
-        return 0.0
+def innings_multiplier(inns):
+    # 0.5 if inns < 5 else (1 if inns < 10 else (1.2 if inns < 50 else 1.5))
+    return np.select([inns < 5, inns < 10, inns < 50], [0.5, 1.0, 1.2], default=1.5)
+
+def mvp_kernel(avg, sr, bat_inn, wpi, eco, bowl_inn, pop_avg, pop_sr, pop_wpi, pop_eco):
+    # Plain ndarray math, independent of the DataFrame, so scores can be recomputed
+    # (e.g. with different medians or weights) without rerunning the pandas pipeline
+
+    # Batting Performance Score
+    # (Quality * Quality) * Normalized Volume
+    bat_factor = (avg / pop_avg) * (sr / pop_sr)
+    bat_score = bat_factor * innings_multiplier(bat_inn)
+
+    # Bowling Performance Score
+    # For Economy, lower is better: Med_Eco / Eco
+    # If innings > 0 but eco is 0, it means perfect bowling (maiden?) or data issue.
+    # Assign a strong multiplier (e.g., 2x median performance)
+    with np.errstate(divide='ignore'):
+        eco_factor = np.where(eco > 0, pop_eco / eco, np.where(bowl_inn > 0, 2.0, 0.0))
+
+    bowl_factor = (wpi / pop_wpi) * eco_factor
+    bowl_score = bowl_factor * innings_multiplier(bowl_inn)
+
+    # Total MVP
+    # Additive to reward specialists as well as all-rounders
+    # Scale factor (e.g. * 100) to make numbers readable
+    return (bat_score + bowl_score) * 100
 
 def calculate_derived_metrics(df):
     if df.empty: return df
-    
-    # helper for safe division
-    def safe_div(n, d):
-        return n / d if d > 0 else 0.0
 
     # 1. Calculate Wickets Per Inning (Global)
     # Use 'Overall_Bowling_Inns' if available, else 'Overall_Bowling_Mat'
-    df['Overall_Bowling_WPI'] = df.apply(lambda r: safe_div(r.get('Overall_Bowling_Wkts', 0), r.get('Overall_Bowling_Inns', 0)), axis=1)
+    bowl_inns_col = df['Overall_Bowling_Inns']
+    df['Overall_Bowling_WPI'] = (df['Overall_Bowling_Wkts'] / bowl_inns_col.replace(0, np.nan)).where(bowl_inns_col > 0, 0.0)
 
     # 2. Statistics for normalization (Median, ignoring zeros)
+    # Zeros become NaN, which median() skips; fall back to the default if nothing is left
+    def pop_median(col, default):
+        med = df[col].replace(0, np.nan).median()
+        return default if pd.isna(med) else med
+
     # Batting
-    bat_avg_series = df[df['Overall_Batting_Avg'] > 0]['Overall_Batting_Avg']
-    bat_sr_series = df[df['Overall_Batting_SR'] > 0]['Overall_Batting_SR']
-    bat_inn_series = df[df['Overall_Batting_Inns'] > 0]['Overall_Batting_Inns']
-    
-    pop_avg = bat_avg_series.median() if not bat_avg_series.empty else 20.0
-    pop_sr = bat_sr_series.median() if not bat_sr_series.empty else 100.0
-    pop_bat_inns = bat_inn_series.median() if not bat_inn_series.empty else 5.0
+    pop_avg = pop_median('Overall_Batting_Avg', 20.0)
+    pop_sr = pop_median('Overall_Batting_SR', 100.0)
+    pop_bat_inns = pop_median('Overall_Batting_Inns', 5.0)
     
     # Bowling
-    bowl_wpi_series = df[df['Overall_Bowling_WPI'] > 0]['Overall_Bowling_WPI']
-    bowl_eco_series = df[df['Overall_Bowling_Eco'] > 0]['Overall_Bowling_Eco']
-    bowl_inn_series = df[df['Overall_Bowling_Inns'] > 0]['Overall_Bowling_Inns']
+    pop_wpi = pop_median('Overall_Bowling_WPI', 1.0)
+    pop_eco = pop_median('Overall_Bowling_Eco', 7.0)
+    pop_bowl_inns = pop_median('Overall_Bowling_Inns', 5.0)
+
+    # 3. MVP score from the raw stat arrays
+    df['MVP_Points'] = mvp_kernel(
+        df['Overall_Batting_Avg'].to_numpy(dtype=np.float64),
+        df['Overall_Batting_SR'].to_numpy(dtype=np.float64),
+        df['Overall_Batting_Inns'].to_numpy(dtype=np.float64),
+        df['Overall_Bowling_WPI'].to_numpy(dtype=np.float64),
+        df['Overall_Bowling_Eco'].to_numpy(dtype=np.float64),
+        df['Overall_Bowling_Inns'].to_numpy(dtype=np.float64),
+        pop_avg, pop_sr, pop_wpi, pop_eco
+    )
+
+    # Role Inference
+    is_bowler = df['Overall_Bowling_Wkts'] > 9
+    is_batter = df['Overall_Batting_Runs'] > 200
+    df['Inferred_Role'] = np.select(
+        [is_bowler & is_batter, is_bowler, is_batter],
+        ['All-Rounder', 'Bowler', 'Batter'],
+        default='Newcomer'
+    )
+    return df
+
+# Full preparation pipeline, cached so widget reruns skip the transforms
+@st.cache_data
+def prepare_data():
+    df = load_data()
+    df = clean_and_convert_numeric(df)
+    df = downcast_numeric(df)
+    df = calculate_derived_metrics(df)
+    return df
+
+df = prepare_data()
+
+# Profile table layout: (display name, [Tennis col, Leather col, Overall col])
+PROFILE_CATEGORIES = ['Tennis', 'Leather', 'Overall']
+
+def _profile_cols(stat_type, mapping):
+    return [(disp, [f'{cat}_{stat_type}_{suffix}' for cat in PROFILE_CATEGORIES]) for disp, suffix in mapping]
+
+BAT_DISPLAY_COLS = _profile_cols('Batting', [
+    ('Matches', 'Mat'), ('Innings', 'Inns'), ('Not Out', 'NO'), ('Runs', 'Runs'),
+    ('High Score', 'HS'), ('Avg', 'Avg'), ('SR', 'SR'), ('100s', '100s'), ('50s', '50s'),
+    ('30s', '30s'), ('4s', '4s'), ('6s', '6s'), ('Ducks', 'Ducks')
+])
+BOWL_DISPLAY_COLS = _profile_cols('Bowling', [
+    ('Matches', 'Mat'), ('Innings', 'Inns'), ('Overs', 'Overs'), ('Maidens', 'Maidens'),
+    ('Runs', 'Runs'), ('Wickets', 'Wkts'), ('Best', 'BB'), ('Avg', 'Avg'), ('Eco', 'Eco'),
+    ('SR', 'SR'), ('3w', '3 Wkts'), ('5w', '5 Wkts'), ('Wides', 'WD'), ('NB', 'NB')
+])
+PROFILE_FLOAT_COLS = {'Avg', 'SR', 'Eco', 'Overs'}
+
+# Comparison tab metrics, grouped by display format
+COMPARE_INT_METRICS = ['Overall_Batting_Runs', 'Overall_Bowling_Wkts', 'BEST BATTER', 'BEST BOWLER', 'PLAYER OF THE MATCH']
+COMPARE_FLOAT_METRICS = ['MVP_Points', 'Overall_Batting_Avg', 'Overall_Batting_SR', 'Overall_Bowling_Eco', 'Overall_Bowling_Avg']
+
+def build_profile_table(player_data, display_cols):
+    table = pd.DataFrame(
+        {disp: [player_data.get(col, 0) for col in cols] for disp, cols in display_cols},
+        index=PROFILE_CATEGORIES
+    )
+    # Handle NaN
+    table = table.where(table.notna(), 0)
+
+    for col in table.columns:
+        if col in PROFILE_FLOAT_COLS:
+            # Keep numeric; placeholders like '-' become NaN (shown via na_rep in Styler.format)
+            table[col] = pd.to_numeric(table[col].astype(str).str.replace('*', '', regex=False), errors='coerce')
+        elif col == 'High Score':
+            # String to handle 50 and 50* consistently without Arrow errors
+            table[col] = table[col].astype(str)
+        else:
+            num = pd.to_numeric(table[col], errors='coerce')
+            if num.isna().any():
+                table[col] = table[col].astype(str) # e.g. Best "5/20"
+            elif (num % 1 == 0).all():
+                table[col] = num.astype(int)
+            else:
+                table[col] = num
+    return table
+
+# Sorted player names for the profile/comparison pickers (tuple: cheap to hash)
+@st.cache_data
+def get_players(df):
+    return tuple(sorted(df['name'].unique().tolist()))
+
+# Name-indexed view for O(1) per-player lookups (first row wins on duplicate names)
+@st.cache_data
+def index_by_name(df):
+    return df.drop_duplicates(subset='name').set_index('name')
+
+# --- Auction Dashboard table views (cached, rebuilt only when df changes) ---
+@st.cache_data
+def build_batters_view(df):
+    # Filter cols
+    bat_cols = ['name', 'Overall_Batting_Runs', 'Overall_Batting_Avg', 'Overall_Batting_SR', 'Overall_Batting_Mat', 'Overall_Batting_HS', 'Overall_Batting_4s', 'Overall_Batting_6s', 'BEST BATTER', 'MVP_Points']
+    # Rename for display
+    bat_disp_map = {
+        'name': 'Name', 'Overall_Batting_Runs': 'Runs', 'Overall_Batting_Avg': 'Avg', 
+        'Overall_Batting_SR': 'SR', 'Overall_Batting_Mat': 'Mat', 'Overall_Batting_HS': 'HS',
+        'Overall_Batting_4s': '4s', 'Overall_Batting_6s': '6s', 'BEST BATTER': '🏏 Awards', 'MVP_Points': 'MVP'
+    }
+    
+    df_bat = df[bat_cols].rename(columns=bat_disp_map)
+    
+    # Ensure numeric for formatting
+    numeric_cols = ['Runs', 'Avg', 'SR', 'MVP', 'Mat', '4s', '6s', '🏏 Awards']
+    df_bat[numeric_cols] = df_bat[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+    return df_bat
+
+@st.cache_data
+def build_bowlers_view(df):
+    bowl_cols = ['name', 'Overall_Bowling_Wkts', 'Overall_Bowling_Eco', 'Overall_Bowling_Avg', 'Overall_Bowling_SR', 'Overall_Bowling_Mat', 'Overall_Bowling_BB', 'BEST BOWLER', 'MVP_Points']
+    bowl_disp_map = {
+        'name': 'Name', 'Overall_Bowling_Wkts': 'Wickets', 'Overall_Bowling_Eco': 'Eco',
+        'Overall_Bowling_Avg': 'Avg', 'Overall_Bowling_SR': 'SR', 'Overall_Bowling_Mat': 'Mat',
+        'Overall_Bowling_BB': 'Best', 'BEST BOWLER': '🥎 Awards', 'MVP_Points': 'MVP'
+    }
+    
+    df_bowl = df[bowl_cols].rename(columns=bowl_disp_map)
+    
+    # Ensure numeric for formatting
+    numeric_cols_bowl = ['Wickets', 'Eco', 'Avg', 'SR', 'MVP', 'Mat', '🥎 Awards']
+    df_bowl[numeric_cols_bowl] = df_bowl[numeric_cols_bowl].apply(pd.to_numeric, errors='coerce').fillna(0)
+    return df_bowl
+
+@st.cache_data
+def build_allrounders_view(df):
+    ar_cols = ['name', 'MVP_Points', 'Overall_Batting_Runs', 'Overall_Bowling_Wkts', 'Overall_Batting_SR', 'Overall_Bowling_Eco', 'BEST BATTER', 'BEST BOWLER', 'PLAYER OF THE MATCH']
+    ar_disp_map = {
+        'name': 'Name', 'MVP_Points': 'MVP Score', 
+        'Overall_Batting_Runs': 'Runs', 'Overall_Bowling_Wkts': 'Wickets',
+        'Overall_Batting_SR': 'Bat SR', 'Overall_Bowling_Eco': 'Bowl Eco',
+        'BEST BATTER': '🏏 Bat Awards', 'BEST BOWLER': '🥎 Bowl Awards', 'PLAYER OF THE MATCH': '🏆 POTM'
+    }
+    
+    # Filter for All-Rounders
+    df_ar_view = df.loc[df['Inferred_Role'] == 'All-Rounder', ar_cols].rename(columns=ar_disp_map)
+    
+    # Ensure numeric
+    numeric_cols_ar = ['MVP Score', 'Bat SR', 'Bowl Eco', 'Runs', 'Wickets', '🏏 Bat Awards', '🥎 Bowl Awards', '🏆 POTM']
+    df_ar_view[numeric_cols_ar] = df_ar_view[numeric_cols_ar].apply(pd.to_numeric, errors='coerce').fillna(0)
+    
+    # Default Sort Descending by MVP Score
+    return df_ar_view.sort_values(by='MVP Score', ascending=False)
+
+# Progress bar scaled to the column max (stands in for Styler.background_gradient)
+def progress_column(series, fmt):
+    top = series.max() if not series.empty else 0
+    return st.column_config.ProgressColumn(format=fmt, min_value=0, max_value=float(top) if pd.notna(top) and top > 0 else 1.0)
+
+# --- Auction Dashboard chart data (only the plotted columns, plus quartile lines) ---
+def chart_projection(df, cols):
+    # float32 stats come from 2-decimal source values; round them back so they serialize
+    # as e.g. 19.91 in the Vega-Lite JSON and tooltips. float64 columns are left as-is.
+    chart_df = df[cols].copy()
+    f32_cols = chart_df.select_dtypes('float32').columns
+    chart_df[f32_cols] = chart_df[f32_cols].astype('float64').round(2)
+    return chart_df
+
+def nonzero_quartiles(series):
+    # Percentile Lines (Ignoring Zeros)
+    series = series[series > 0]
+    return series.quantile([0.25, 0.50, 0.75]).tolist() if not series.empty else []
+
+@st.cache_data
+def batter_chart_data(df):
+    chart_df = chart_projection(df, ['name', 'Overall_Batting_SR', 'Overall_Batting_Avg', 'Overall_Batting_Runs', 'MVP_Points', 'Inferred_Role'])
+    return chart_df, nonzero_quartiles(df['Overall_Batting_SR']), nonzero_quartiles(df['Overall_Batting_Avg'])
+
+@st.cache_data
+def bowler_chart_data(df):
+    chart_df = chart_projection(df, ['name', 'Overall_Bowling_Eco', 'Overall_Bowling_WPI', 'Overall_Bowling_Wkts', 'MVP_Points', 'Inferred_Role'])
+    return chart_df, nonzero_quartiles(df['Overall_Bowling_Eco']), nonzero_quartiles(df['Overall_Bowling_WPI'])
+
+# --- Individual Profile (fragment: reruns only when its own widgets change) ---
+@st.fragment
+def render_profile(df):
+    st.markdown("### Individual Profile Search")
+    if 'name' in df.columns:
+        players_list = get_players(df)
+        selected_player = st.selectbox(
+            "Choose a player", 
+            options=players_list,
+            placeholder="Search..."
+        )
+        
+        if selected_player:
+            data = index_by_name(df).loc[selected_player].to_dict()
+            
+            # --- Reuse existing profile layout logic ---
+            
+            st.subheader(f"Player Profile: {selected_player}", divider='red')
+            
+            # Extract CricHeroes Info
+            ch_raw = str(data.get('cricheroes', ''))
+            
+            # Format extracted_id as int if possible
+            # (stored as text like '17725457.0', so coerce rather than int() the string)
+            eid = data.get('extracted_id', pd.NA)
+            eid_num = pd.to_numeric(eid, errors='coerce')
+            ch_display = "N/A"
+            if pd.notna(eid_num):
+                ch_display = str(int(eid_num))
+            elif pd.notna(eid) and str(eid).lower() != 'nan':
+                ch_display = str(eid)
+
+            ch_link = None
+            if ch_raw and ch_raw.lower() != 'nan' and 'cricheroes' in ch_raw.lower():
+                ch_link = ch_raw
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown(f"**CricHeroes Profile ID:** {ch_display}")
+                if ch_link:
+                    st.markdown(f"🔗 [View Profile]({ch_link})", unsafe_allow_html=True)
+            with col2:
+                st.info(f"**Player Type:** {data.get('playertype', 'N/A')}")
+            with col3:
+                st.info(f"**Team Owner:** {data.get('Team Owner', 'N/A')}")
+            
+            # Batting
+            df_bat_prof = build_profile_table(data, BAT_DISPLAY_COLS)
+
+            # Bowling
+            df_bowl_prof = build_profile_table(data, BOWL_DISPLAY_COLS)
+            
+            st.markdown("#### Batting Stats")
+            fmt_bat = {c: "{:.2f}" for c in df_bat_prof.columns if c in PROFILE_FLOAT_COLS}
+            st.dataframe(df_bat_prof.style.format(fmt_bat, na_rep='-').set_properties(**{'text-align': 'center'}), use_container_width=True)
+            
+            st.markdown("#### Bowling Stats")
+            fmt_bowl = {c: "{:.2f}" for c in df_bowl_prof.columns if c in PROFILE_FLOAT_COLS}
+            st.dataframe(df_bowl_prof.style.format(fmt_bowl, na_rep='-').set_properties(**{'text-align': 'center'}), use_container_width=True)
+            
+            # Awards Section
+            st.markdown("#### Awards")
+            
+            # Get award counts
+            best_batter = int(data.get('BEST BATTER', 0)) if pd.notna(data.get('BEST BATTER', 0)) else 0
+            best_bowler = int(data.get('BEST BOWLER', 0)) if pd.notna(data.get('BEST BOWLER', 0)) else 0
+            potm = int(data.get('PLAYER OF THE MATCH', 0)) if pd.notna(data.get('PLAYER OF THE MATCH', 0)) else 0
+            
+            st.markdown(AWARDS_TEMPLATE.format(best_batter=best_batter, best_bowler=best_bowler, potm=potm), unsafe_allow_html=True)
+    else:
+        st.error("Name column missing.")
+
+# --- Player Comparison ---
+@st.fragment
+def render_compare(df):
+    st.markdown("### Player Comparison")
+    players_to_compare = st.multiselect("Select Players to Compare", options=get_players(df), max_selections=4)
     
-    pop_wpi = bowl_wpi_series.median() if not bowl_wpi_series.empty else 1.0
-    pop_eco = bowl_eco_series.median() if not bowl_eco_series.empty else 7.0
-    pop_bowl_inns = bowl_inn_series.median() if not bowl_inn_series.empty else 5.0
+    if players_to_compare:
+        df_idx = index_by_name(df)
+        
+        # Pre-format all compared metrics at once (NaN / non-numeric -> 0)
+        fmt_df = df_idx.loc[players_to_compare, COMPARE_INT_METRICS + COMPARE_FLOAT_METRICS]
+        fmt_df = fmt_df.apply(pd.to_numeric, errors='coerce').fillna(0)
+        fmt_df[COMPARE_INT_METRICS] = fmt_df[COMPARE_INT_METRICS].astype(int).astype(str)
+        fmt_df[COMPARE_FLOAT_METRICS] = fmt_df[COMPARE_FLOAT_METRICS].apply(lambda s: s.map('{:.2f}'.format))
+
+        cols = st.columns(len(players_to_compare))
+        for idx, player in enumerate(players_to_compare):
+            with cols[idx]:
+                st.success(f"**{player}**")
+                st.metric("MVP Score", fmt_df.at[player, 'MVP_Points'])
+                st.markdown("---")
+                st.metric("Runs", fmt_df.at[player, 'Overall_Batting_Runs'])
+                st.metric("Bat Avg", fmt_df.at[player, 'Overall_Batting_Avg'])
+                st.metric("Bat SR", fmt_df.at[player, 'Overall_Batting_SR'])
+                st.markdown("---")
+                st.metric("Wickets", fmt_df.at[player, 'Overall_Bowling_Wkts'])
+                st.metric("Bowl Eco", fmt_df.at[player, 'Overall_Bowling_Eco'])
+                st.metric("Bowl Avg", fmt_df.at[player, 'Overall_Bowling_Avg'])
+                st.markdown("---")
+                st.metric("🏏 Best Batter", fmt_df.at[player, 'BEST BATTER'])
+                st.metric("🥎 Best Bowler", fmt_df.at[player, 'BEST BOWLER'])
+                st.metric("🏆 POTM", fmt_df.at[player, 'PLAYER OF THE MATCH'])
 
-    mvp_scores = []
-    roles = []
+# --- Auction Dashboard ---
+@st.fragment
+def render_auction(df):
+    st.markdown("### Auction Data Pool")
+    
+    # Sub-tabs for roles
+    subtab_bat, subtab_bowl, subtab_ar = st.tabs(["🏏 Batters", "🥎 Bowlers", "🌟 All-Rounders"])
     
-    for _, row in df.iterrows():
-        # Batting Components
-        avg = row.get('Overall_Batting_Avg', 0)
-        sr = row.get('Overall_Batting_SR', 0)
-        bat_inn = row.get('Overall_Batting_Inns', 0)
+    with subtab_bat:
+        st.markdown("#### Top Batsmen")
+        df_bat = build_batters_view(df)
         
-        # Batting Performance Score
-        # (Quality * Quality) * Normalized Volume
-        bat_factor = (avg / pop_avg) * (sr / pop_sr)
-        bat_score = bat_factor * (0.5 if bat_inn < 5 else (1 if bat_inn < 10 else (1.2 if bat_inn < 50 else 1.5)))
+        # Interactive Dataframe (native column formatting; bars replace the colour gradient)
+        st.dataframe(
+            df_bat,
+            column_config={
+                'Avg': st.column_config.NumberColumn(format="%.2f"),
+                'SR': st.column_config.NumberColumn(format="%.2f"),
+                'MVP': progress_column(df_bat['MVP'], "%.0f"),
+                'Runs': progress_column(df_bat['Runs'], "%d"),
+                'Mat': st.column_config.NumberColumn(format="%d"),
+                'HS': st.column_config.NumberColumn(format="%d"),
+                '4s': st.column_config.NumberColumn(format="%d"),
+                '6s': st.column_config.NumberColumn(format="%d"),
+                '🏏 Awards': st.column_config.NumberColumn(format="%d")
+            },
+            use_container_width=True,
+            height=500
+        )
         
-        # Bowling Components
-        wpi = row.get('Overall_Bowling_WPI', 0)
-        eco = row.get('Overall_Bowling_Eco', 0)
-        bowl_inn = row.get('Overall_Bowling_Inns', 0)
+        # Scatter Plot with Percentile Lines
+        st.markdown("##### 📊 Aggression vs Consistency")
         
-        # Bowling Performance Score
-        # For Economy, lower is better: Med_Eco / Eco
-        eco_factor = 0
-        if eco > 0:
-            eco_factor = pop_eco / eco
-        elif bowl_inn > 0:
-            # If innings > 0 but eco is 0, it means perfect bowling (maiden?) or data issue.
-            # Assign a strong multiplier (e.g., 2x median performance)
-            eco_factor = 2.0 
-            
-        bowl_factor = (wpi / pop_wpi) * eco_factor
-        bowl_score = bowl_factor * (0.5 if bowl_inn < 5 else (1 if bowl_inn < 10 else (1.2 if bowl_inn < 50 else 1.5)))
+        chart_df_bat, x_quantiles, y_quantiles = batter_chart_data(df)
         
-        # Total MVP
-        # Additive to reward specialists as well as all-rounders
-        # Scale factor (e.g. * 100) to make numbers readable
-        total_mvp = (bat_score + bowl_score) * 100
-        mvp_scores.append(total_mvp)
+        # Base Chart
+        base_bat = alt.Chart(chart_df_bat).mark_circle(size=60).encode(
+            x=alt.X('Overall_Batting_SR', title='Strike Rate'),
+            y=alt.Y('Overall_Batting_Avg', title='Average'),
+            color=alt.Color('Inferred_Role', legend=alt.Legend(title="Role", titleColor='white', labelColor='white')),
+            size=alt.Size('MVP_Points', legend=alt.Legend(title="MVP", titleColor='white', labelColor='white', symbolFillColor='lightgray')),
+            tooltip=['name', 'Overall_Batting_Runs', 'Overall_Batting_Avg', 'Overall_Batting_SR', 'MVP_Points']
+        ).interactive()
         
-        # Role Inference
-        runs = row.get('Overall_Batting_Runs', 0)
-        wickets = row.get('Overall_Bowling_Wkts', 0)
-        is_bowler = wickets > 9
-        is_batter = runs > 200
+        # Percentile Lines
+        rules_x = alt.Chart(pd.DataFrame({'x': x_quantiles})).mark_rule(color='#FFD700', strokeDash=[5,5], opacity=0.8).encode(x='x')
+        rules_y = alt.Chart(pd.DataFrame({'y': y_quantiles})).mark_rule(color='#FFD700', strokeDash=[5,5], opacity=0.8).encode(y='y')
         
-        if is_bowler and is_batter:
-            role = 'All-Rounder'
-        elif is_bowler:
-            role = 'Bowler'
-        elif is_batter:
-            role = 'Batter'
-        else:
-            role = 'Newcomer' 
-            
-        roles.append(role)
+        final_chart_bat = (base_bat + rules_x + rules_y)
         
-    df['MVP_Points'] = mvp_scores
-    df['Inferred_Role'] = roles
-    return df
+        st.altair_chart(final_chart_bat, use_container_width=True)
 
-df = calculate_derived_metrics(df)
-
-# Helper to normalize stats
-def normalize_stats(row, category, stat_type):
-    stats = {}
-    prefix = f"{category}_{stat_type}"
-    
-    if stat_type == 'Batting':
-        mapping = {
-            'Matches': f'{prefix}_Mat',
-            'Innings': f'{prefix}_Inns',
-            'Not Out': f'{prefix}_NO',
-            'Runs': f'{prefix}_Runs',
-            'High Score': f'{prefix}_HS',
-            'Avg': f'{prefix}_Avg',
-            'SR': f'{prefix}_SR',
-            '100s': f'{prefix}_100s',
-            '50s': f'{prefix}_50s',
-            '30s': f'{prefix}_30s',
-            '4s': f'{prefix}_4s',
-            '6s': f'{prefix}_6s',
-            'Ducks': f'{prefix}_Ducks'
-        }
-    else: # Bowling
-        mapping = {
-            'Matches': f'{prefix}_Mat',
-            'Innings': f'{prefix}_Inns',
-            'Overs': f'{prefix}_Overs',
-            'Maidens': f'{prefix}_Maidens',
-            'Runs': f'{prefix}_Runs',
-            'Wickets': f'{prefix}_Wkts',
-            'Best': f'{prefix}_BB',
-            'Avg': f'{prefix}_Avg',
-            'Eco': f'{prefix}_Eco',
-            'SR': f'{prefix}_SR',
-            '3w': f'{prefix}_3 Wkts',
-            '5w': f'{prefix}_5 Wkts',
-            'Wides': f'{prefix}_WD',
-            'NB': f'{prefix}_NB'
-        }
-
-    for standard_col, raw_col in mapping.items():
-        val = row.get(raw_col, 0)
-        # Handle NaN
-        if pd.isna(val) or str(val) == 'nan':
-             val = 0
-        stats[standard_col] = val
+    with subtab_bowl:
+        st.markdown("#### Top Bowlers")
+        df_bowl = build_bowlers_view(df)
         
-    return stats
+        # Interactive Dataframe (native column formatting; bars replace the colour gradient)
+        st.dataframe(
+            df_bowl,
+            column_config={
+                'Eco': st.column_config.NumberColumn(format="%.2f"),
+                'Avg': st.column_config.NumberColumn(format="%.2f"),
+                'SR': st.column_config.NumberColumn(format="%.2f"),
+                'MVP': progress_column(df_bowl['MVP'], "%.0f"),
+                'Wickets': progress_column(df_bowl['Wickets'], "%d"),
+                'Mat': st.column_config.NumberColumn(format="%d"),
+                '🥎 Awards': st.column_config.NumberColumn(format="%d")
+            },
+            use_container_width=True,
+            height=500
+        )
+        
+        st.markdown("##### 🎯 Economy vs Wickets per Inning")
+        
+        chart_df_bowl, x_metrics_bowl, y_metrics_bowl = bowler_chart_data(df)
+        
+        # Base Chart
+        base_bowl = alt.Chart(chart_df_bowl).mark_circle(size=60).encode(
+            x=alt.X('Overall_Bowling_Eco', title='Economy'),
+            y=alt.Y('Overall_Bowling_WPI', title='Wickets / Inning'),
+            color=alt.Color('Inferred_Role', legend=alt.Legend(title="Role", titleColor='white', labelColor='white')),
+            size=alt.Size('MVP_Points', legend=alt.Legend(title="MVP", titleColor='white', labelColor='white', symbolFillColor='lightgray')),
+            tooltip=['name', 'Overall_Bowling_Wkts', 'Overall_Bowling_WPI', 'Overall_Bowling_Eco', 'MVP_Points']
+        ).interactive()
+        
+        # Percentile Lines
+        rules_x_bowl = alt.Chart(pd.DataFrame({'x': x_metrics_bowl})).mark_rule(color='#FFD700', strokeDash=[5,5], opacity=0.8).encode(x='x')
+        rules_y_bowl = alt.Chart(pd.DataFrame({'y': y_metrics_bowl})).mark_rule(color='#FFD700', strokeDash=[5,5], opacity=0.8).encode(y='y')
+        
+        final_chart_bowl = (base_bowl + rules_x_bowl + rules_y_bowl)
+        
+        st.altair_chart(final_chart_bowl, use_container_width=True)
 
-def safe_int(val):
-    try:
-        f = float(val)
-        if f.is_integer():
-            return int(f)
-        return f
-    except:
-        return val
-
-def format_value(val, key):
-    # Formatting rules
-    # Float columns: Avg, SR, Eco
-    # Float columns: Avg, SR, Eco, Overs
-    float_cols = ['Avg', 'SR', 'Eco', 'Overs']
-    if any(x in key for x in float_cols):
-        try:
-            val_str = str(val).replace('*', '') # Handle 12.34* if any
-            if val_str == '-' or val_str == '': return val
-            return "{:.2f}".format(float(val_str))
-        except:
-            return val
-    
-    # High Score should be string to handle 50 and 50* consistently without Arrow errors
-    if 'HS' in key or 'High Score' in key:
-        return str(val)
-            
-    # Integer columns: everything else usually
-    # But check if it's strictly numeric
-    try:
-        f = float(val)
-        if f.is_integer():
-            return int(f)
-        return f # Return float if not integer
-    except:
-        return val # Return string (e.g. "5/20")
+    with subtab_ar:
+        st.markdown("#### All-Rounders & MVP Leaderboard")
+        df_ar_view = build_allrounders_view(df)
+        
+        
+        st.dataframe(
+            df_ar_view,
+            column_config={
+                'MVP Score': progress_column(df_ar_view['MVP Score'], "%.0f"),
+                'Bat SR': st.column_config.NumberColumn(format="%.2f"),
+                'Bowl Eco': st.column_config.NumberColumn(format="%.2f"),
+                'Runs': st.column_config.NumberColumn(format="%d"),
+                'Wickets': st.column_config.NumberColumn(format="%d"),
+                '🏏 Bat Awards': st.column_config.NumberColumn(format="%d"),
+                '🥎 Bowl Awards': st.column_config.NumberColumn(format="%d"),
+                '🏆 POTM': st.column_config.NumberColumn(format="%d")
+            },
+            use_container_width=True,
+            height=800
+        )
+        
+        # st.markdown("##### ⚖️ Balance of Play")
 
 if df.empty:
     st.error("Could not load data.")
 else:
-    # Main Tab Navigation
-    st.markdown("""
-    <style>
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 2px;
-        }
-        .stTabs [data-baseweb="tab"] {
-            height: 50px;
-            white-space: pre-wrap;
-            background-color: transparent;
-            border-radius: 4px 4px 0px 0px;
-            gap: 1px;
-            padding-top: 10px;
-            padding-bottom: 10px;
-        }
-        .stTabs [aria-selected="true"] {
-             background-color: rgba(255, 255, 255, 0.05);
-             border-bottom: 2px solid #FF4B4B;
-        }
-    </style>
-    """, unsafe_allow_html=True)
-    
     # Define Tabs
     tab_auction, tab_profile , tab_compare = st.tabs([
         "🔨 Auction Dashboard",
@@ -329,344 +660,12 @@ else:
 
     # --- 1. Individual Profile ---
     with tab_profile:
-        st.markdown("### Individual Profile Search")
-        if 'name' in df.columns:
-            players_list = sorted(df['name'].unique().tolist())
-            selected_player = st.selectbox(
-                "Choose a player", 
-                options=players_list,
-                placeholder="Search..."
-            )
-            
-            if selected_player:
-                player_row = df[df['name'] == selected_player].iloc[0]
-                
-                # --- Reuse existing profile layout logic ---
-                
-                st.subheader(f"Player Profile: {selected_player}", divider='red')
-                
-                # Extract CricHeroes Info
-                ch_raw = str(player_row.get('cricheroes', ''))
-                
-                # Format extracted_id as int if possible
-                eid = player_row.get('extracted_id', pd.NA)
-                ch_display = "N/A"
-                if pd.notna(eid):
-                    try:
-                        ch_display = str(int(eid))
-                    except:
-                        ch_display = str(eid)
-
-                ch_link = None
-                if ch_raw and ch_raw.lower() != 'nan' and 'cricheroes' in ch_raw.lower():
-                    ch_link = ch_raw
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.markdown(f"**CricHeroes Profile ID:** {ch_display}")
-                    if ch_link:
-                        st.markdown(f"🔗 [View Profile]({ch_link})", unsafe_allow_html=True)
-                with col2:
-                    st.info(f"**Player Type:** {player_row.get('playertype', 'N/A')}")
-                with col3:
-                    st.info(f"**Team Owner:** {player_row.get('Team Owner', 'N/A')}")
-                
-                # Batting
-                t_bat = normalize_stats(player_row, 'Tennis', 'Batting')
-                l_bat = normalize_stats(player_row, 'Leather', 'Batting')
-                o_bat = normalize_stats(player_row, 'Overall', 'Batting')
-                
-                bat_data = [t_bat, l_bat, o_bat]
-                df_bat_prof = pd.DataFrame(bat_data, index=['Tennis', 'Leather', 'Overall'])
-                
-                # Force High Score 'HS' to string to avoid Arrow mixed-type error
-                # Check for likely names from normalize_stats
-                for col in df_bat_prof.columns:
-                     if 'HS' in col or 'High Score' in col:
-                         df_bat_prof[col] = df_bat_prof[col].astype(str)
-
-                for col in df_bat_prof.columns:
-                    df_bat_prof[col] = df_bat_prof[col].apply(lambda x: format_value(x, col))
-
-                # Bowling
-                t_bowl = normalize_stats(player_row, 'Tennis', 'Bowling')
-                l_bowl = normalize_stats(player_row, 'Leather', 'Bowling')
-                o_bowl = normalize_stats(player_row, 'Overall', 'Bowling')
-                
-                bowl_data = [t_bowl, l_bowl, o_bowl]
-                df_bowl_prof = pd.DataFrame(bowl_data, index=['Tennis', 'Leather', 'Overall'])
-                for col in df_bowl_prof.columns:
-                    df_bowl_prof[col] = df_bowl_prof[col].apply(lambda x: format_value(x, col))
-                
-                st.markdown("#### Batting Stats")
-                st.dataframe(df_bat_prof.style.set_properties(**{'text-align': 'center'}), use_container_width=True)
-                
-                st.markdown("#### Bowling Stats")
-                st.dataframe(df_bowl_prof.style.set_properties(**{'text-align': 'center'}), use_container_width=True)
-                
-                # Awards Section
-                st.markdown("#### Awards")
-                
-                # Get award counts
-                best_batter = int(player_row.get('BEST BATTER', 0)) if pd.notna(player_row.get('BEST BATTER', 0)) else 0
-                best_bowler = int(player_row.get('BEST BOWLER', 0)) if pd.notna(player_row.get('BEST BOWLER', 0)) else 0
-                potm = int(player_row.get('PLAYER OF THE MATCH', 0)) if pd.notna(player_row.get('PLAYER OF THE MATCH', 0)) else 0
-                
-                award_col1, award_col2, award_col3 = st.columns(3)
-                with award_col1:
-                    st.markdown(f"""
-                    <div class="award-box">
-                        <div class="award-icon">🏏</div>
-                        <div class="award-title">Best Batter</div>
-                        <div class="award-count">{best_batter}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                with award_col2:
-                    st.markdown(f"""
-                    <div class="award-box">
-                        <div class="award-icon">🥎</div>
-                        <div class="award-title">Best Bowler</div>
-                        <div class="award-count">{best_bowler}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                with award_col3:
-                    st.markdown(f"""
-                    <div class="award-box">
-                        <div class="award-icon">🏆</div>
-                        <div class="award-title">Player of the Match</div>
-                        <div class="award-count">{potm}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-        else:
-            st.error("Name column missing.")
+        render_profile(df)
 
     # --- 2. Player Comparison ---
     with tab_compare:
-        st.markdown("### Player Comparison")
-        players_to_compare = st.multiselect("Select Players to Compare", options=sorted(df['name'].unique()), max_selections=4)
-        
-        if players_to_compare:
-            df_comp = df[df['name'].isin(players_to_compare)]
-            
-            # Helper for metrics
-            def safe_metric_fmt(val, is_int=False):
-                # Handle NaN, None, and empty values
-                if pd.isna(val) or val is None or str(val).lower() == 'nan':
-                    return "0" if is_int else "0.00"
-                try:
-                    f = float(str(val).replace('*', ''))
-                    if is_int:
-                        return f"{int(f)}"
-                    return f"{f:.2f}"
-                except:
-                    return "0" if is_int else "0.00"
-
-            cols = st.columns(len(players_to_compare))
-            for idx, player in enumerate(players_to_compare):
-                p_data = df_comp[df_comp['name'] == player].iloc[0]
-                with cols[idx]:
-                    st.success(f"**{player}**")
-                    st.metric("MVP Score", safe_metric_fmt(p_data.get('MVP_Points', 0), is_int=False))
-                    st.markdown("---")
-                    st.metric("Runs", safe_metric_fmt(p_data.get('Overall_Batting_Runs', 0), is_int=True))
-                    st.metric("Bat Avg", safe_metric_fmt(p_data.get('Overall_Batting_Avg', 0), is_int=False))
-                    st.metric("Bat SR", safe_metric_fmt(p_data.get('Overall_Batting_SR', 0), is_int=False))
-                    st.markdown("---")
-                    st.metric("Wickets", safe_metric_fmt(p_data.get('Overall_Bowling_Wkts', 0), is_int=True))
-                    st.metric("Bowl Eco", safe_metric_fmt(p_data.get('Overall_Bowling_Eco', 0), is_int=False))
-                    st.metric("Bowl Avg", safe_metric_fmt(p_data.get('Overall_Bowling_Avg', 0), is_int=False))
-                    st.markdown("---")
-                    st.metric("🏏 Best Batter", safe_metric_fmt(p_data.get('BEST BATTER', 0), is_int=True))
-                    st.metric("🥎 Best Bowler", safe_metric_fmt(p_data.get('BEST BOWLER', 0), is_int=True))
-                    st.metric("🏆 POTM", safe_metric_fmt(p_data.get('PLAYER OF THE MATCH', 0), is_int=True))
+        render_compare(df)
 
     # --- 3. Auction Dashboard ---
     with tab_auction:
-        st.markdown("### Auction Data Pool")
-        
-        # Sub-tabs for roles
-        subtab_bat, subtab_bowl, subtab_ar = st.tabs(["🏏 Batters", "🥎 Bowlers", "🌟 All-Rounders"])
-        
-        with subtab_bat:
-            st.markdown("#### Top Batsmen")
-            # Filter cols
-            bat_cols = ['name', 'Overall_Batting_Runs', 'Overall_Batting_Avg', 'Overall_Batting_SR', 'Overall_Batting_Mat', 'Overall_Batting_HS', 'Overall_Batting_4s', 'Overall_Batting_6s', 'BEST BATTER', 'MVP_Points']
-            # Rename for display
-            bat_disp_map = {
-                'name': 'Name', 'Overall_Batting_Runs': 'Runs', 'Overall_Batting_Avg': 'Avg', 
-                'Overall_Batting_SR': 'SR', 'Overall_Batting_Mat': 'Mat', 'Overall_Batting_HS': 'HS',
-                'Overall_Batting_4s': '4s', 'Overall_Batting_6s': '6s', 'BEST BATTER': '🏏 Awards', 'MVP_Points': 'MVP'
-            }
-            
-            df_bat = df[bat_cols].copy()
-            df_bat.rename(columns=bat_disp_map, inplace=True)
-            
-            # Ensure numeric for formatting
-            numeric_cols = ['Runs', 'Avg', 'SR', 'MVP', 'Mat', '4s', '6s', '🏏 Awards']
-            for col in numeric_cols:
-                df_bat[col] = pd.to_numeric(df_bat[col], errors='coerce').fillna(0)
-            
-            # Interactive Dataframe
-            styled_df = df_bat.style.format({
-                'Avg': "{:.2f}", 
-                'SR': "{:.2f}", 
-                'MVP': "{:.0f}",
-                'Runs': "{:.0f}",
-                'Mat': "{:.0f}",
-                'HS': "{:.0f}",
-                '4s': "{:.0f}",
-                '6s': "{:.0f}",
-                '🏏 Awards': "{:.0f}"
-            }).background_gradient(subset=['Runs', 'SR', 'MVP'], cmap='Greens')
-            
-            # Apply center alignment using set_table_styles
-            styled_df = styled_df.set_table_styles([
-                {'selector': 'th', 'props': [('text-align', 'center')]},
-                {'selector': 'td', 'props': [('text-align', 'center')]}
-            ])
-            
-            st.dataframe(
-                styled_df,
-                use_container_width=True,
-                height=500
-            )
-            
-            # Scatter Plot with Percentile Lines
-            st.markdown("##### 📊 Aggression vs Consistency")
-            
-            # Base Chart
-            base_bat = alt.Chart(df).mark_circle(size=60).encode(
-                x=alt.X('Overall_Batting_SR', title='Strike Rate'),
-                y=alt.Y('Overall_Batting_Avg', title='Average'),
-                color=alt.Color('Inferred_Role', legend=alt.Legend(title="Role", titleColor='white', labelColor='white')),
-                size=alt.Size('MVP_Points', legend=alt.Legend(title="MVP", titleColor='white', labelColor='white', symbolFillColor='lightgray')),
-                tooltip=['name', 'Overall_Batting_Runs', 'Overall_Batting_Avg', 'Overall_Batting_SR', 'MVP_Points']
-            ).interactive()
-            
-            # Percentile Lines (Ignoring Zeros)
-            sr_series = df[df['Overall_Batting_SR'] > 0]['Overall_Batting_SR']
-            avg_series = df[df['Overall_Batting_Avg'] > 0]['Overall_Batting_Avg']
-            
-            x_quantiles = sr_series.quantile([0.25, 0.50, 0.75]).tolist() if not sr_series.empty else []
-            y_quantiles = avg_series.quantile([0.25, 0.50, 0.75]).tolist() if not avg_series.empty else []
-            
-            rules_x = alt.Chart(pd.DataFrame({'x': x_quantiles})).mark_rule(color='#FFD700', strokeDash=[5,5], opacity=0.8).encode(x='x')
-            rules_y = alt.Chart(pd.DataFrame({'y': y_quantiles})).mark_rule(color='#FFD700', strokeDash=[5,5], opacity=0.8).encode(y='y')
-            
-            final_chart_bat = (base_bat + rules_x + rules_y)
-            
-            st.altair_chart(final_chart_bat, use_container_width=True)
-
-        with subtab_bowl:
-            st.markdown("#### Top Bowlers")
-            bowl_cols = ['name', 'Overall_Bowling_Wkts', 'Overall_Bowling_Eco', 'Overall_Bowling_Avg', 'Overall_Bowling_SR', 'Overall_Bowling_Mat', 'Overall_Bowling_BB', 'BEST BOWLER', 'MVP_Points']
-            bowl_disp_map = {
-                'name': 'Name', 'Overall_Bowling_Wkts': 'Wickets', 'Overall_Bowling_Eco': 'Eco',
-                'Overall_Bowling_Avg': 'Avg', 'Overall_Bowling_SR': 'SR', 'Overall_Bowling_Mat': 'Mat',
-                'Overall_Bowling_BB': 'Best', 'BEST BOWLER': '🥎 Awards', 'MVP_Points': 'MVP'
-            }
-            
-            df_bowl = df[bowl_cols].copy()
-            df_bowl.rename(columns=bowl_disp_map, inplace=True)
-            
-            # Ensure numeric for formatting
-            numeric_cols_bowl = ['Wickets', 'Eco', 'Avg', 'SR', 'MVP', 'Mat', '🥎 Awards']
-            for col in numeric_cols_bowl:
-                df_bowl[col] = pd.to_numeric(df_bowl[col], errors='coerce').fillna(0)
-            
-            # Interactive Dataframe
-            styled_df_bowl = df_bowl.style.format({
-                'Eco': "{:.2f}", 
-                'Avg': "{:.2f}", 
-                'SR': "{:.2f}", 
-                'MVP': "{:.0f}",
-                'Wickets': "{:.0f}",
-                'Mat': "{:.0f}",
-                '🥎 Awards': "{:.0f}"
-            }).background_gradient(subset=['Wickets', 'Eco', 'MVP'], cmap='Blues')
-            
-            # Apply center alignment using set_table_styles
-            styled_df_bowl = styled_df_bowl.set_table_styles([
-                {'selector': 'th', 'props': [('text-align', 'center')]},
-                {'selector': 'td', 'props': [('text-align', 'center')]}
-            ])
-            
-            st.dataframe(
-                styled_df_bowl,
-                use_container_width=True,
-                height=500
-            )
-            
-            st.markdown("##### 🎯 Economy vs Wickets per Inning")
-            
-            # Base Chart
-            base_bowl = alt.Chart(df).mark_circle(size=60).encode(
-                x=alt.X('Overall_Bowling_Eco', title='Economy'),
-                y=alt.Y('Overall_Bowling_WPI', title='Wickets / Inning'),
-                color=alt.Color('Inferred_Role', legend=alt.Legend(title="Role", titleColor='white', labelColor='white')),
-                size=alt.Size('MVP_Points', legend=alt.Legend(title="MVP", titleColor='white', labelColor='white', symbolFillColor='lightgray')),
-                tooltip=['name', 'Overall_Bowling_Wkts', 'Overall_Bowling_WPI', 'Overall_Bowling_Eco', 'MVP_Points']
-            ).interactive()
-            
-            # Percentile Lines (Ignoring Zeros)
-            eco_series = df[df['Overall_Bowling_Eco'] > 0]['Overall_Bowling_Eco']
-            wpi_series = df[df['Overall_Bowling_WPI'] > 0]['Overall_Bowling_WPI']
-            
-            x_metrics_bowl = eco_series.quantile([0.25, 0.50, 0.75]).tolist() if not eco_series.empty else []
-            y_metrics_bowl = wpi_series.quantile([0.25, 0.50, 0.75]).tolist() if not wpi_series.empty else []
-            
-            rules_x_bowl = alt.Chart(pd.DataFrame({'x': x_metrics_bowl})).mark_rule(color='#FFD700', strokeDash=[5,5], opacity=0.8).encode(x='x')
-            rules_y_bowl = alt.Chart(pd.DataFrame({'y': y_metrics_bowl})).mark_rule(color='#FFD700', strokeDash=[5,5], opacity=0.8).encode(y='y')
-            
-            final_chart_bowl = (base_bowl + rules_x_bowl + rules_y_bowl)
-            
-            st.altair_chart(final_chart_bowl, use_container_width=True)
-
-        with subtab_ar:
-            st.markdown("#### All-Rounders & MVP Leaderboard")
-            # Filter for All-Rounders
-            df_ar = df[df['Inferred_Role'] == 'All-Rounder'].copy()
-            
-            ar_cols = ['name', 'MVP_Points', 'Overall_Batting_Runs', 'Overall_Bowling_Wkts', 'Overall_Batting_SR', 'Overall_Bowling_Eco', 'BEST BATTER', 'BEST BOWLER', 'PLAYER OF THE MATCH']
-            ar_disp_map = {
-                'name': 'Name', 'MVP_Points': 'MVP Score', 
-                'Overall_Batting_Runs': 'Runs', 'Overall_Bowling_Wkts': 'Wickets',
-                'Overall_Batting_SR': 'Bat SR', 'Overall_Bowling_Eco': 'Bowl Eco',
-                'BEST BATTER': '🏏 Bat Awards', 'BEST BOWLER': '🥎 Bowl Awards', 'PLAYER OF THE MATCH': '🏆 POTM'
-            }
-            
-            df_ar_view = df_ar[ar_cols].copy().rename(columns=ar_disp_map)
-            
-            # Ensure numeric
-            numeric_cols_ar = ['MVP Score', 'Bat SR', 'Bowl Eco', 'Runs', 'Wickets', '🏏 Bat Awards', '🥎 Bowl Awards', '🏆 POTM']
-            for col in numeric_cols_ar:
-                df_ar_view[col] = pd.to_numeric(df_ar_view[col], errors='coerce').fillna(0)
-            
-            # Default Sort Descending by MVP Score
-            df_ar_view = df_ar_view.sort_values(by='MVP Score', ascending=False)
-            
-            
-            styled_df_ar = df_ar_view.style.format({
-                'MVP Score': "{:.0f}", 
-                'Bat SR': "{:.2f}", 
-                'Bowl Eco': "{:.2f}",
-                'Runs': "{:.0f}",
-                'Wickets': "{:.0f}",
-                '🏏 Bat Awards': "{:.0f}",
-                '🥎 Bowl Awards': "{:.0f}",
-                '🏆 POTM': "{:.0f}"
-            }).highlight_max(subset=['MVP Score'], color='lightgreen', axis=0)
-            
-            # Apply center alignment using set_table_styles
-            styled_df_ar = styled_df_ar.set_table_styles([
-                {'selector': 'th', 'props': [('text-align', 'center')]},
-                {'selector': 'td', 'props': [('text-align', 'center')]}
-            ])
-            
-            st.dataframe(
-                styled_df_ar,
-                use_container_width=True,
-                height=800
-            )
-            
-            # st.markdown("##### ⚖️ Balance of Play")
+        render_auction(df)